@@ -1,66 +1,91 @@
 """
 Validation tools package.
 
-Provides quality validation components from the library.
+Provides quality validation (quality_validator) and spec validation
+(spec_validation) components from the library.
 """
 
-from .quality_validator import (
-    QualityValidator,
-    QualityClaim,
-    QualityValidationResult,
-    ValidationResult,
-    Violation,
-    AnalysisResult,
-    EvidenceQuality,
-    RiskLevel,
-    Severity,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
 
-from .spec_validation import (
-    SpecValidator,
-    SpecValidationResult,
-    ValidationSchema,
-    BaseValidator,
-    PrereqsValidator,
-    JSONFileValidator,
-    ContextValidator,
-    MarkdownDocumentValidator,
-    SpecDocumentValidator,
-    ImplementationPlanValidator,
-    validate_spec_directory,
-    create_validator_from_config,
-    DEFAULT_CONTEXT_SCHEMA,
-    DEFAULT_IMPLEMENTATION_PLAN_SCHEMA,
-    DEFAULT_SPEC_REQUIRED_SECTIONS,
-    DEFAULT_SPEC_RECOMMENDED_SECTIONS,
-)
+if TYPE_CHECKING:
+    # Eager imports for type checkers and IDEs; at runtime names load lazily
+    from .quality_validator import (
+        QualityValidator,
+        QualityClaim,
+        QualityValidationResult,
+        ValidationResult,
+        Violation,
+        AnalysisResult,
+        EvidenceQuality,
+        RiskLevel,
+        Severity,
+    )
 
-__all__ = [
+    from .spec_validation import (
+        SpecValidator,
+        SpecValidationResult,
+        ValidationSchema,
+        BaseValidator,
+        PrereqsValidator,
+        JSONFileValidator,
+        ContextValidator,
+        MarkdownDocumentValidator,
+        SpecDocumentValidator,
+        ImplementationPlanValidator,
+        validate_spec_directory,
+        create_validator_from_config,
+        DEFAULT_CONTEXT_SCHEMA,
+        DEFAULT_IMPLEMENTATION_PLAN_SCHEMA,
+        DEFAULT_SPEC_REQUIRED_SECTIONS,
+        DEFAULT_SPEC_RECOMMENDED_SECTIONS,
+    )
+
+# Exported names mapped to the submodule that defines them. Submodules are
+# imported on first attribute access (PEP 562), so consumers of one
+# validator do not pay the import cost of the other.
+_LAZY: Dict[str, str] = {
     # Quality Validator exports
-    "QualityValidator",
-    "QualityClaim",
-    "QualityValidationResult",
-    "ValidationResult",
-    "Violation",
-    "AnalysisResult",
-    "EvidenceQuality",
-    "RiskLevel",
-    "Severity",
+    "QualityValidator": ".quality_validator",
+    "QualityClaim": ".quality_validator",
+    "QualityValidationResult": ".quality_validator",
+    "ValidationResult": ".quality_validator",
+    "Violation": ".quality_validator",
+    "AnalysisResult": ".quality_validator",
+    "EvidenceQuality": ".quality_validator",
+    "RiskLevel": ".quality_validator",
+    "Severity": ".quality_validator",
     # Spec Validator exports
-    "SpecValidator",
-    "SpecValidationResult",
-    "ValidationSchema",
-    "BaseValidator",
-    "PrereqsValidator",
-    "JSONFileValidator",
-    "ContextValidator",
-    "MarkdownDocumentValidator",
-    "SpecDocumentValidator",
-    "ImplementationPlanValidator",
-    "validate_spec_directory",
-    "create_validator_from_config",
-    "DEFAULT_CONTEXT_SCHEMA",
-    "DEFAULT_IMPLEMENTATION_PLAN_SCHEMA",
-    "DEFAULT_SPEC_REQUIRED_SECTIONS",
-    "DEFAULT_SPEC_RECOMMENDED_SECTIONS",
-]
+    "SpecValidator": ".spec_validation",
+    "SpecValidationResult": ".spec_validation",
+    "ValidationSchema": ".spec_validation",
+    "BaseValidator": ".spec_validation",
+    "PrereqsValidator": ".spec_validation",
+    "JSONFileValidator": ".spec_validation",
+    "ContextValidator": ".spec_validation",
+    "MarkdownDocumentValidator": ".spec_validation",
+    "SpecDocumentValidator": ".spec_validation",
+    "ImplementationPlanValidator": ".spec_validation",
+    "validate_spec_directory": ".spec_validation",
+    "create_validator_from_config": ".spec_validation",
+    "DEFAULT_CONTEXT_SCHEMA": ".spec_validation",
+    "DEFAULT_IMPLEMENTATION_PLAN_SCHEMA": ".spec_validation",
+    "DEFAULT_SPEC_REQUIRED_SECTIONS": ".spec_validation",
+    "DEFAULT_SPEC_RECOMMENDED_SECTIONS": ".spec_validation",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    """Import the defining submodule on first access to an exported name."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(__all__)
@@ -12,6 +12,7 @@ from datetime import datetime
 from enum import Enum
 import json
 from pathlib import Path
+import sys
 from typing import Any, Dict, List, Optional, Union
 
 # LEGO Import: Use shared types from library for common validation types
@@ -42,6 +43,23 @@ except ImportError:
             INFO = "info"
 
 
+# slots=True needs Python 3.10+; older interpreters get regular dataclasses
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Severity vocabulary used by QualityValidator, most to least severe.
+# Precomputed so hot paths do plain dict/set lookups on the string values.
+_SEVERITY_ORDER = ("critical", "high", "medium", "low", "info")
+_SEVERITY_RANK = {severity: rank for rank, severity in enumerate(_SEVERITY_ORDER)}
+_VALID_SEVERITIES = frozenset(_SEVERITY_ORDER)
+_SARIF_LEVELS = {
+    "critical": "error",
+    "high": "error",
+    "medium": "warning",
+    "low": "note",
+    "info": "note",
+}
+
+
 class EvidenceQuality(Enum):
     """Evidence quality categories"""
     EXCELLENT = "excellent"
@@ -58,7 +76,7 @@ class RiskLevel(Enum):
     HIGH = "high"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class QualityClaim:
     """
     Quality improvement claim to be validated.
@@ -97,7 +115,7 @@ class QualityClaim:
 # NOTE: This module uses a specialized QualityValidationResult for quality claim validation.
 # For simple validation needs, use library.common.types.ValidationResult.
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class QualityValidationResult:
     """
     Result of quality claim validation.
@@ -157,7 +175,7 @@ if BaseViolation is not None:
 else:
     _BaseViolationAvailable = False
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Violation:
     """
     Represents a quality violation for the QualityValidator.
@@ -274,7 +292,7 @@ class Violation:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AnalysisResult:
     """Results from quality analysis"""
     violations: List[Violation] = field(default_factory=list)
@@ -391,11 +409,10 @@ class QualityValidator:
             The created Violation object
         """
         # Validate severity against allowed values
-        valid_severities = {"critical", "high", "medium", "low", "info"}
         severity_normalized = severity.lower()
-        if severity_normalized not in valid_severities:
+        if severity_normalized not in _VALID_SEVERITIES:
             raise ValueError(
-                f"Invalid severity '{severity}'. Must be one of: {', '.join(sorted(valid_severities))}"
+                f"Invalid severity '{severity}'. Must be one of: {', '.join(sorted(_VALID_SEVERITIES))}"
             )
         violation = Violation(
             rule_id=rule_id,
@@ -442,22 +459,20 @@ class QualityValidator:
         Returns:
             True if gate passes, False otherwise
         """
-        severity_order = ["critical", "high", "medium", "low", "info"]
-        # Normalize input and validate membership before index lookup
+        # Normalize input and validate membership before rank lookup
         fail_on_normalized = fail_on.lower()
-        if fail_on_normalized not in severity_order:
+        if fail_on_normalized not in _SEVERITY_RANK:
             raise ValueError(
-                f"Invalid severity '{fail_on}'. Must be one of: {', '.join(severity_order)}"
+                f"Invalid severity '{fail_on}'. Must be one of: {', '.join(_SEVERITY_ORDER)}"
             )
-        fail_index = severity_order.index(fail_on_normalized)
+        fail_index = _SEVERITY_RANK[fail_on_normalized]
 
         # Count violations by severity
         counts = self._count_by_severity()
         thresholds = self.config["thresholds"]
 
         # Check if any severity at or above threshold is exceeded
-        for i in range(fail_index + 1):
-            severity = severity_order[i]
+        for severity in _SEVERITY_ORDER[:fail_index + 1]:
             count = counts.get(severity, 0)
             threshold = thresholds.get(f"max_{severity}", 0)
 
@@ -468,13 +483,7 @@ class QualityValidator:
 
     def _count_by_severity(self) -> Dict[str, int]:
         """Count violations by severity"""
-        counts: Dict[str, int] = {
-            "critical": 0,
-            "high": 0,
-            "medium": 0,
-            "low": 0,
-            "info": 0,
-        }
+        counts: Dict[str, int] = dict.fromkeys(_SEVERITY_ORDER, 0)
         for v in self.violations:
             if v.severity in counts:
                 counts[v.severity] += 1
@@ -852,11 +861,4 @@ class QualityValidator:
 
     def _sarif_level(self, severity: str) -> str:
         """Map severity to SARIF level"""
-        mapping = {
-            "critical": "error",
-            "high": "error",
-            "medium": "warning",
-            "low": "note",
-            "info": "note",
-        }
-        return mapping.get(severity, "warning")
+        return _SARIF_LEVELS.get(severity, "warning")
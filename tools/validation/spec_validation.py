@@ -46,17 +46,27 @@ Usage:
 
 from __future__ import annotations
 
+import copy
 import json
 import os
 import re
+import sys
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import (
     Any,
     Callable,
+    Collection,
     Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
     List,
+    Mapping,
     Optional,
     Protocol,
     Sequence,
@@ -73,6 +83,32 @@ try:
 except ImportError:
     ASYNC_AVAILABLE = False
 
+# Optional native JSON decoding
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_loads(content: Union[str, bytes]) -> Any:
+    """
+    Decode JSON, using orjson when it is installed.
+
+    Input orjson rejects is retried with json.loads, so documents json
+    accepts (e.g. NaN/Infinity literals) stay valid and invalid documents
+    get the standard json error message. One difference remains: orjson
+    decodes integers beyond 64 bits as floats, where json keeps them exact.
+    Schema checks are unaffected, but custom validators see the float.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(content)
+
+
 # LEGO Import: Use shared types from library for common validation types
 try:
     from library.common.types import SpecValidationResult as BaseSpecValidationResult, Violation, Severity
@@ -90,13 +126,145 @@ except ImportError:
 # Pre-compiled Regex Patterns (LOW-SPEC-01 fix)
 # ============================================================================
 
-def _compile_section_pattern(section: str) -> re.Pattern[str]:
-    """Compile a regex pattern for matching markdown section headers."""
-    return re.compile(rf"^#+\s*{re.escape(section)}", re.MULTILINE | re.IGNORECASE)
+SectionMatcher = Tuple[
+    "re.Pattern[str]",
+    Optional["re.Pattern[bytes]"],
+    Tuple[FrozenSet[str], ...],
+]
+
+
+def _compile_section_matcher(sections: Tuple[str, ...]) -> SectionMatcher:
+    """
+    Compile a single regex matching any of the given markdown section headers.
+
+    Each section is its own capturing group, ordered longest first, so each
+    header line reports its longest matching section through lastindex. The
+    returned expansions map that group to every section the header also
+    satisfies, since a header such as "## Files to Modify" also satisfies
+    a "Files" section.
+
+    When every section name is ASCII, an equivalent bytes pattern is compiled
+    too, for scanning documents that do not need decoding (see _markdown_text).
+
+    Returns:
+        Tuple of (str pattern, bytes pattern or None, expansions by group index)
+    """
+    ordered = sorted(dict.fromkeys(sections), key=len, reverse=True)
+    alternatives = "|".join(f"({re.escape(section)})" for section in ordered)
+    source = rf"^#+\s*(?:{alternatives})"
+    flags = re.MULTILINE | re.IGNORECASE
+    text_pattern = re.compile(source, flags)
+    bytes_pattern = re.compile(source.encode("ascii"), flags) if source.isascii() else None
+    expansions: Tuple[FrozenSet[str], ...] = (frozenset(),) + tuple(
+        frozenset(
+            other for other in ordered
+            if re.match(re.escape(other), section, re.IGNORECASE)
+        )
+        for section in ordered
+    )
+    return text_pattern, bytes_pattern, expansions
+
+
+# Bytes that make scanning raw content differ from scanning the decoded text:
+# non-ASCII, carriage returns (read as newlines) and the ASCII separators
+# that str patterns also treat as whitespace
+_NEEDS_DECODING = re.compile(rb"[\r\x1c-\x1f\x80-\xff]")
+
+
+def _markdown_text(content: bytes) -> Union[str, bytes]:
+    """
+    Prepare raw markdown content for section scanning and length checks.
+
+    Plain ASCII content with \\n line endings is returned unchanged, since
+    bytes patterns match it exactly like its decoded text. Anything else is
+    decoded with universal newlines, as Path.read_text() would.
+    """
+    if _NEEDS_DECODING.search(content) is None:
+        return content
+    text = content.decode("utf-8", errors="replace")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+# Cache for compiled section matchers, keyed by the section names they match
+_SECTION_PATTERN_CACHE: Dict[Tuple[str, ...], SectionMatcher] = {}
+
+
+class _LRUCache:
+    """Small least-recently-used cache for values shared across schemas."""
+
+    def __init__(self, maxsize: int = 128) -> None:
+        """
+        Initialize LRU cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value for key (marking it recently used), or None."""
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+
+
+# Cache for compiled validation schemas, keyed by serialized schema definition.
+# Schemas with custom validators are not shared, so their functions are not
+# kept alive by the cache.
+_VALIDATOR_CACHE = _LRUCache(maxsize=128)
+
+# Allowed-value types whose JSON form identifies the value exactly
+_JSON_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+# ============================================================================
+# Parsed Document Cache
+# ============================================================================
+
+def _file_cache_key(filepath: Path) -> Tuple[str, int, int]:
+    """Build a (path, mtime_ns, size) key so edited files are re-read."""
+    file_stat = filepath.stat()
+    return str(filepath), file_stat.st_mtime_ns, file_stat.st_size
 
 
-# Cache for compiled section patterns
-_SECTION_PATTERN_CACHE: Dict[str, re.Pattern[str]] = {}
+@lru_cache(maxsize=256)
+def _load_json(path_str: str, mtime_ns: int, size: int) -> Any:
+    """
+    Load and parse a JSON file, memoized by path, mtime and size.
+
+    The parsed document is shared between callers and must be treated
+    as read-only.
+    """
+    with open(path_str, "rb") as f:
+        return _json_loads(f.read())
+
+
+@lru_cache(maxsize=256)
+def _load_markdown(path_str: str, mtime_ns: int, size: int) -> bytes:
+    """Load a markdown file's raw bytes, memoized by path, mtime and size."""
+    with open(path_str, "rb") as f:
+        return f.read()
+
+
+def _clear_document_cache() -> None:
+    """Clear memoized file contents so the next validation re-reads from disk."""
+    _load_json.cache_clear()
+    _load_markdown.cache_clear()
 
 
 # ============================================================================
@@ -125,11 +293,55 @@ class Validatable(Protocol):
 # Schema Configuration
 # ============================================================================
 
-@dataclass
+@dataclass(frozen=True)
+class _CompiledSchema:
+    """
+    Pre-processed form of a ValidationSchema used on the validation hot path.
+
+    Attributes:
+        required_fields: Required field names, in declaration order
+        optional_fields: Optional field names
+        required_fields_either: Field groups where at least one must be present
+        allowed_values: Mapping of field names to allowed values (a frozenset,
+            or a tuple when some values are unhashable)
+        custom_validators: (field name, validator function) pairs
+        nested_schemas: Mapping of field names to compiled nested schemas
+    """
+
+    required_fields: Tuple[str, ...]
+    optional_fields: FrozenSet[str]
+    required_fields_either: Tuple[Tuple[str, ...], ...]
+    allowed_values: Dict[str, Collection[Any]]
+    custom_validators: Tuple[Tuple[str, Callable[[Any], Optional[str]]], ...]
+    nested_schemas: Dict[str, "_CompiledSchema"]
+
+
+def _allowed_collection(values: Iterable[Any]) -> Collection[Any]:
+    """Build a frozenset of allowed values, or a tuple if some are unhashable."""
+    ordered = tuple(values)
+    try:
+        return frozenset(ordered)
+    except TypeError:
+        return ordered
+
+
+def _is_allowed(value: Any, allowed: Collection[Any]) -> bool:
+    """Check membership in allowed values, treating unhashable values as unknown."""
+    try:
+        return value in allowed
+    except TypeError:
+        return False
+
+
+@dataclass(frozen=True)
 class ValidationSchema:
     """
     Configuration schema for validation rules.
 
+    Schemas are immutable: sequences are stored as tuples and mappings as
+    read-only views, so a compiled form can be cached safely. Use
+    dataclasses.replace() to derive a modified schema.
+
     Attributes:
         required_fields: Fields that must be present
         optional_fields: Fields that may be present
@@ -138,14 +350,124 @@ class ValidationSchema:
         custom_validators: Mapping of field names to validation functions
     """
 
-    required_fields: List[str] = field(default_factory=list)
-    optional_fields: List[str] = field(default_factory=list)
-    allowed_values: Dict[str, List[str]] = field(default_factory=dict)
-    nested_schemas: Dict[str, "ValidationSchema"] = field(default_factory=dict)
-    custom_validators: Dict[str, Callable[[Any], Optional[str]]] = field(
+    required_fields: Sequence[str] = ()
+    optional_fields: Sequence[str] = ()
+    allowed_values: Mapping[str, Sequence[str]] = field(default_factory=dict)
+    nested_schemas: Mapping[str, "ValidationSchema"] = field(default_factory=dict)
+    custom_validators: Mapping[str, Callable[[Any], Optional[str]]] = field(
         default_factory=dict
     )
-    required_fields_either: List[List[str]] = field(default_factory=list)
+    required_fields_either: Sequence[Sequence[str]] = ()
+
+    def __post_init__(self) -> None:
+        frozen = {
+            "required_fields": tuple(self.required_fields),
+            "optional_fields": tuple(self.optional_fields),
+            "allowed_values": MappingProxyType(
+                {name: tuple(values) for name, values in self.allowed_values.items()}
+            ),
+            "nested_schemas": MappingProxyType(dict(self.nested_schemas)),
+            "custom_validators": MappingProxyType(dict(self.custom_validators)),
+            "required_fields_either": tuple(
+                tuple(group) for group in self.required_fields_either
+            ),
+        }
+        for name, value in frozen.items():
+            object.__setattr__(self, name, value)
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        # Read-only mapping views cannot be pickled; rebuild from plain dicts
+        return (
+            type(self),
+            (
+                self.required_fields,
+                self.optional_fields,
+                dict(self.allowed_values),
+                dict(self.nested_schemas),
+                dict(self.custom_validators),
+                self.required_fields_either,
+            ),
+        )
+
+    def _cache_key(self) -> Optional[str]:
+        """
+        Serialize the declarative schema definition into a stable cache key.
+
+        Returns None when the compiled form must not be shared: the schema
+        (or a nested schema) uses custom validators, or an allowed value is
+        not a plain JSON scalar, so serializing it could make distinct values
+        look identical (e.g. "1" and Decimal("1")).
+        """
+        if self.custom_validators:
+            return None
+        if any(
+            type(value) not in _JSON_SCALAR_TYPES
+            for values in self.allowed_values.values()
+            for value in values
+        ):
+            return None
+
+        nested_keys: Dict[str, str] = {}
+        for name, nested in self.nested_schemas.items():
+            nested_key = nested._cache_key()
+            if nested_key is None:
+                return None
+            nested_keys[name] = nested_key
+
+        definition = {
+            "required_fields": self.required_fields,
+            "optional_fields": self.optional_fields,
+            "allowed_values": dict(self.allowed_values),
+            "required_fields_either": self.required_fields_either,
+            "nested_schemas": nested_keys,
+        }
+        try:
+            return json.dumps(definition, sort_keys=True, allow_nan=False)
+        except (TypeError, ValueError):
+            return None
+
+    def compiled(self) -> _CompiledSchema:
+        """
+        Get the pre-processed form of this schema.
+
+        Compiled forms are shared between all schemas with an identical
+        definition, so validators created per directory reuse the same
+        instance. Schemas with custom validators or non-JSON allowed values
+        are compiled per instance.
+
+        Returns:
+            _CompiledSchema for this definition
+        """
+        compiled = self.__dict__.get("_compiled")
+        if compiled is not None:
+            return compiled
+
+        key = self._cache_key()
+        if key is not None:
+            compiled = _VALIDATOR_CACHE.get(key)
+        if compiled is None:
+            compiled = _CompiledSchema(
+                required_fields=tuple(self.required_fields),
+                optional_fields=frozenset(self.optional_fields),
+                required_fields_either=tuple(
+                    tuple(group) for group in self.required_fields_either
+                ),
+                allowed_values={
+                    name: _allowed_collection(values)
+                    for name, values in self.allowed_values.items()
+                },
+                custom_validators=tuple(self.custom_validators.items()),
+                nested_schemas={
+                    name: nested.compiled()
+                    for name, nested in self.nested_schemas.items()
+                },
+            )
+            if key is not None:
+                _VALIDATOR_CACHE.put(key, compiled)
+
+        # Frozen dataclass: cache on the instance without going through __setattr__
+        self.__dict__["_compiled"] = compiled
+        return compiled
 
     def validate_data(
         self,
@@ -162,62 +484,72 @@ class ValidationSchema:
         Returns:
             Tuple of (errors, warnings) lists
         """
-        errors: List[str] = []
-        warnings: List[str] = []
-
-        # Check required fields
-        for req_field in self.required_fields:
-            if req_field not in data:
-                errors.append(f"{prefix}Missing required field: {req_field}")
-
-        # Check required_fields_either (at least one from each group)
-        for group in self.required_fields_either:
-            if not any(f in data for f in group):
-                errors.append(
-                    f"{prefix}Missing one of required fields: {', '.join(group)}"
-                )
-
-        # Check allowed values
-        for field_name, allowed in self.allowed_values.items():
-            if field_name not in data:
-                continue
-            if data[field_name] in allowed:
-                continue
-            warnings.append(
-                f"{prefix}Unknown value for {field_name}: {data[field_name]}"
+        compiled = self.compiled()
+        return _validate_compiled(compiled, data, prefix)
+
+
+def _validate_compiled(
+    schema: _CompiledSchema,
+    data: Dict[str, Any],
+    prefix: str,
+) -> tuple[List[str], List[str]]:
+    """Validate data against a compiled schema (see ValidationSchema.validate_data)."""
+    errors: List[str] = []
+    warnings: List[str] = []
+
+    # Check required fields
+    for req_field in schema.required_fields:
+        if req_field not in data:
+            errors.append(f"{prefix}Missing required field: {req_field}")
+
+    # Check required_fields_either (at least one from each group)
+    for group in schema.required_fields_either:
+        if not any(f in data for f in group):
+            errors.append(
+                f"{prefix}Missing one of required fields: {', '.join(group)}"
             )
 
-        # Run custom validators
-        for field_name, validator_fn in self.custom_validators.items():
-            if field_name in data:
-                error = validator_fn(data[field_name])
-                if error:
-                    errors.append(f"{prefix}{field_name}: {error}")
+    # Check allowed values
+    for field_name, allowed in schema.allowed_values.items():
+        if field_name not in data:
+            continue
+        if _is_allowed(data[field_name], allowed):
+            continue
+        warnings.append(
+            f"{prefix}Unknown value for {field_name}: {data[field_name]}"
+        )
 
-        # Validate nested schemas
-        for field_name, nested_schema in self.nested_schemas.items():
-            if field_name not in data:
-                continue
-            nested_data = data[field_name]
-            if isinstance(nested_data, dict):
-                nested_errors, nested_warnings = nested_schema.validate_data(
-                    nested_data, prefix=f"{prefix}{field_name}."
-                )
-                errors.extend(nested_errors)
-                warnings.extend(nested_warnings)
-                continue
-            if not isinstance(nested_data, list):
+    # Run custom validators
+    for field_name, validator_fn in schema.custom_validators:
+        if field_name in data:
+            error = validator_fn(data[field_name])
+            if error:
+                errors.append(f"{prefix}{field_name}: {error}")
+
+    # Validate nested schemas
+    for field_name, nested_schema in schema.nested_schemas.items():
+        if field_name not in data:
+            continue
+        nested_data = data[field_name]
+        if isinstance(nested_data, dict):
+            nested_errors, nested_warnings = _validate_compiled(
+                nested_schema, nested_data, f"{prefix}{field_name}."
+            )
+            errors.extend(nested_errors)
+            warnings.extend(nested_warnings)
+            continue
+        if not isinstance(nested_data, list):
+            continue
+        for i, item in enumerate(nested_data):
+            if not isinstance(item, dict):
                 continue
-            for i, item in enumerate(nested_data):
-                if not isinstance(item, dict):
-                    continue
-                item_errors, item_warnings = nested_schema.validate_data(
-                    item, prefix=f"{prefix}{field_name}[{i}]."
-                )
-                errors.extend(item_errors)
-                warnings.extend(item_warnings)
+            item_errors, item_warnings = _validate_compiled(
+                nested_schema, item, f"{prefix}{field_name}[{i}]."
+            )
+            errors.extend(item_errors)
+            warnings.extend(item_warnings)
 
-        return errors, warnings
+    return errors, warnings
 
 
 # ============================================================================
@@ -337,20 +669,20 @@ DEFAULT_REQUIREMENTS_SCHEMA = ValidationSchema(
     ],
 )
 
-# Default markdown section requirements
-DEFAULT_SPEC_REQUIRED_SECTIONS: List[str] = [
+# Default markdown section requirements (frozensets for O(1) membership checks)
+DEFAULT_SPEC_REQUIRED_SECTIONS: FrozenSet[str] = frozenset({
     "Overview",
     "Workflow Type",
     "Task Scope",
     "Success Criteria",
-]
+})
 
-DEFAULT_SPEC_RECOMMENDED_SECTIONS: List[str] = [
+DEFAULT_SPEC_RECOMMENDED_SECTIONS: FrozenSet[str] = frozenset({
     "Files to Modify",
     "Files to Reference",
     "Requirements",
     "QA Acceptance Criteria",
-]
+})
 
 
 # ============================================================================
@@ -360,7 +692,11 @@ DEFAULT_SPEC_RECOMMENDED_SECTIONS: List[str] = [
 # fields. For simple validation needs, use library.common.types.SpecValidationResult.
 # ============================================================================
 
-@dataclass
+# Results are created per checkpoint; slots=True needs Python 3.10+
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class SpecValidationResult:
     """
     Result of a spec validation check.
@@ -621,7 +957,13 @@ class JSONFileValidator(BaseValidator):
         warnings: List[str],
         fixes: List[str],
     ) -> None:
-        """Process and validate JSON data against schema."""
+        """
+        Process and validate JSON data against schema.
+
+        The built-in implementation receives the memoized document shared
+        by every validation of the same file and must not modify it.
+        Overrides receive a private deep copy and may modify it freely.
+        """
         schema_errors, schema_warnings = self.schema.validate_data(data)
         errors.extend(schema_errors)
         warnings.extend(schema_warnings)
@@ -644,8 +986,10 @@ class JSONFileValidator(BaseValidator):
             )
 
         try:
-            with open(filepath, encoding="utf-8") as f:
-                data = json.load(f)
+            data = _load_json(*_file_cache_key(filepath))
+            if type(self)._process_json_data is not JSONFileValidator._process_json_data:
+                # Overrides may modify the data; keep the memoized document intact
+                data = copy.deepcopy(data)
 
             self._process_json_data(data, errors, warnings, fixes)
 
@@ -690,9 +1034,9 @@ class JSONFileValidator(BaseValidator):
             )
 
         try:
-            async with aiofiles.open(filepath, encoding="utf-8") as f:
+            async with aiofiles.open(filepath, "rb") as f:
                 content = await f.read()
-                data = json.loads(content)
+                data = _json_loads(content)
 
             self._process_json_data(data, errors, warnings, fixes)
 
@@ -735,6 +1079,15 @@ class ContextValidator(JSONFileValidator):
         )
 
 
+def _section_list(sections: Optional[Iterable[str]]) -> List[str]:
+    """Normalize section names to a list, sorting sets so messages are stable."""
+    if not sections:
+        return []
+    if isinstance(sections, (set, frozenset)):
+        return sorted(sections)
+    return list(sections)
+
+
 class MarkdownDocumentValidator(BaseValidator):
     """
     Validates a markdown document for required sections.
@@ -748,8 +1101,8 @@ class MarkdownDocumentValidator(BaseValidator):
         spec_dir: Path,
         filename: str,
         checkpoint_name: str,
-        required_sections: Optional[List[str]] = None,
-        recommended_sections: Optional[List[str]] = None,
+        required_sections: Optional[Iterable[str]] = None,
+        recommended_sections: Optional[Iterable[str]] = None,
         min_length: int = 500,
         not_found_fix: str = "Create the required markdown file",
     ) -> None:
@@ -760,39 +1113,57 @@ class MarkdownDocumentValidator(BaseValidator):
             spec_dir: Path to spec directory
             filename: Name of markdown file
             checkpoint_name: Name for validation checkpoint
-            required_sections: List of required section headers
-            recommended_sections: List of recommended section headers
+            required_sections: Required section headers
+            recommended_sections: Recommended section headers
             min_length: Minimum content length (characters)
             not_found_fix: Suggested fix when file not found
         """
         super().__init__(spec_dir)
         self.filename = filename
         self.checkpoint_name = checkpoint_name
-        self.required_sections = required_sections or []
-        self.recommended_sections = recommended_sections or []
+        self.required_sections = _section_list(required_sections)
+        self.recommended_sections = _section_list(recommended_sections)
         self.min_length = min_length
         self.not_found_fix = not_found_fix
 
     @staticmethod
-    def _get_section_pattern(section: str) -> re.Pattern[str]:
+    def _find_sections(text: Union[str, bytes], sections: Sequence[str]) -> FrozenSet[str]:
         """
-        Get a compiled regex pattern for a section header.
+        Find which of the given sections have a header in the text.
 
-        Uses module-level cache to avoid recompiling patterns.
+        Scans the document once with a combined pattern from the
+        module-level cache instead of searching once per section.
 
         Args:
-            section: Section name to match
+            text: Markdown text, or raw content as returned by _markdown_text
+            sections: Section names to look for
 
         Returns:
-            Compiled regex pattern
+            Set of section names present in the text
         """
-        if section not in _SECTION_PATTERN_CACHE:
-            _SECTION_PATTERN_CACHE[section] = _compile_section_pattern(section)
-        return _SECTION_PATTERN_CACHE[section]
+        key = tuple(sections)
+        if not key:
+            return frozenset()
+        if key not in _SECTION_PATTERN_CACHE:
+            _SECTION_PATTERN_CACHE[key] = _compile_section_matcher(key)
+        text_pattern, bytes_pattern, expansions = _SECTION_PATTERN_CACHE[key]
+
+        pattern: "re.Pattern[Any]" = text_pattern
+        if isinstance(text, bytes):
+            if bytes_pattern is None:
+                text = text.decode("ascii")
+            else:
+                pattern = bytes_pattern
+
+        found: set = set()
+        for match in pattern.finditer(text):
+            # lastindex is the group of the matched section (never None here)
+            found.update(expansions[match.lastindex or 0])
+        return frozenset(found)
 
     def _validate_content(
         self,
-        content: str,
+        content: bytes,
         errors: List[str],
         warnings: List[str],
         fixes: List[str],
@@ -801,28 +1172,32 @@ class MarkdownDocumentValidator(BaseValidator):
         Validate markdown content against section requirements.
 
         Args:
-            content: Markdown file content
+            content: Raw UTF-8 markdown file content
             errors: List to append errors to
             warnings: List to append warnings to
             fixes: List to append fixes to
         """
-        # Check for required sections using pre-compiled patterns
+        text = _markdown_text(content)
+        found = self._find_sections(
+            text, [*self.required_sections, *self.recommended_sections]
+        )
+
+        # Check for required sections
         for section in self.required_sections:
-            pattern = self._get_section_pattern(section)
-            if not pattern.search(content):
+            if section not in found:
                 errors.append(f"Missing required section: {section}")
                 fixes.append(f"Add '## {section}' section to {self.filename}")
 
-        # Check for recommended sections using pre-compiled patterns
+        # Check for recommended sections
         for section in self.recommended_sections:
-            pattern = self._get_section_pattern(section)
-            if not pattern.search(content):
+            if section not in found:
                 warnings.append(f"Missing recommended section: {section}")
 
-        # Check minimum content length
-        if len(content) < self.min_length:
+        # Check minimum content length in characters
+        length = len(text)
+        if length < self.min_length:
             warnings.append(
-                f"Document seems too short ({len(content)} chars, "
+                f"Document seems too short ({length} chars, "
                 f"recommended minimum: {self.min_length})"
             )
 
@@ -842,7 +1217,7 @@ class MarkdownDocumentValidator(BaseValidator):
             )
 
         try:
-            content = filepath.read_text(encoding="utf-8")
+            content = _load_markdown(*_file_cache_key(filepath))
             self._validate_content(content, errors, warnings, fixes)
 
         except OSError as e:
@@ -883,7 +1258,7 @@ class MarkdownDocumentValidator(BaseValidator):
             )
 
         try:
-            async with aiofiles.open(filepath, encoding="utf-8") as f:
+            async with aiofiles.open(filepath, "rb") as f:
                 content = await f.read()
             self._validate_content(content, errors, warnings, fixes)
 
@@ -905,8 +1280,8 @@ class SpecDocumentValidator(MarkdownDocumentValidator):
     def __init__(
         self,
         spec_dir: Path,
-        required_sections: Optional[List[str]] = None,
-        recommended_sections: Optional[List[str]] = None,
+        required_sections: Optional[Iterable[str]] = None,
+        recommended_sections: Optional[Iterable[str]] = None,
     ) -> None:
         """
         Initialize spec document validator.
@@ -927,6 +1302,34 @@ class SpecDocumentValidator(MarkdownDocumentValidator):
         )
 
 
+def _phase_label(index: int, phase: Dict[str, Any]) -> Any:
+    """Identify a phase in messages by its id, phase number, or list index."""
+    return phase.get("id", phase.get("phase", f"index_{index}"))
+
+
+def _iter_subtasks(
+    phases: List[Dict[str, Any]],
+) -> Iterator[Tuple[Any, Any, Dict[str, Any]]]:
+    """
+    Flatten phases[].subtasks[] into a single stream.
+
+    Non-dict phases and subtasks, and non-list subtask fields, are skipped.
+
+    Yields:
+        Tuples of (phase label, subtask label, subtask)
+    """
+    for i, phase in enumerate(phases):
+        if not isinstance(phase, dict):
+            continue
+        subtasks = phase.get("subtasks")
+        if not isinstance(subtasks, list):
+            continue
+        phase_id = _phase_label(i, phase)
+        for j, subtask in enumerate(subtasks):
+            if isinstance(subtask, dict):
+                yield phase_id, subtask.get("id", f"subtask_{j}"), subtask
+
+
 class ImplementationPlanValidator(BaseValidator):
     """
     Validates implementation_plan.json structure.
@@ -957,7 +1360,14 @@ class ImplementationPlanValidator(BaseValidator):
         warnings: List[str],
         fixes: List[str],
     ) -> None:
-        """Process and validate plan data against schema."""
+        """
+        Process and validate plan data against schema.
+
+        The built-in implementation receives the memoized document shared
+        by every validation of the same file and must not modify it.
+        Overrides of this method or _validate_phases receive a private deep
+        copy and may modify it freely.
+        """
         # Validate against schema
         schema_errors, schema_warnings = self.schema.validate_data(plan)
         errors.extend(schema_errors)
@@ -986,8 +1396,14 @@ class ImplementationPlanValidator(BaseValidator):
             )
 
         try:
-            with open(plan_file, encoding="utf-8") as f:
-                plan = json.load(f)
+            plan = _load_json(*_file_cache_key(plan_file))
+            cls = type(self)
+            if (
+                cls._process_plan_data is not ImplementationPlanValidator._process_plan_data
+                or cls._validate_phases is not ImplementationPlanValidator._validate_phases
+            ):
+                # Overrides may modify the plan; keep the memoized document intact
+                plan = copy.deepcopy(plan)
 
             self._process_plan_data(plan, errors, warnings, fixes)
 
@@ -1026,9 +1442,9 @@ class ImplementationPlanValidator(BaseValidator):
             )
 
         try:
-            async with aiofiles.open(plan_file, encoding="utf-8") as f:
+            async with aiofiles.open(plan_file, "rb") as f:
                 content = await f.read()
-                plan = json.loads(content)
+                plan = _json_loads(content)
 
             self._process_plan_data(plan, errors, warnings, fixes)
 
@@ -1056,14 +1472,17 @@ class ImplementationPlanValidator(BaseValidator):
             warnings: List to append warnings to
             fixes: List to append fixes to
         """
-        phase_schema = self.schema.nested_schemas.get("phases")
+        phase_schema = self.schema.compiled().nested_schemas.get("phases")
         if not phase_schema:
             return
 
         subtask_schema = phase_schema.nested_schemas.get("subtasks")
+        allowed_status = subtask_schema.allowed_values.get("status") if subtask_schema else None
 
         for i, phase in enumerate(phases):
-            phase_id = phase.get("id", phase.get("phase", f"index_{i}"))
+            if not isinstance(phase, dict):
+                continue
+            phase_id = _phase_label(i, phase)
 
             # Check for at least one identifier
             has_id = "id" in phase or "phase" in phase
@@ -1079,27 +1498,27 @@ class ImplementationPlanValidator(BaseValidator):
                         f"Phase {phase_id}: Missing required field '{req_field}'"
                     )
 
-            # Validate subtasks
-            if "subtasks" not in phase or not subtask_schema:
-                continue
+        if not subtask_schema:
+            return
 
-            for j, subtask in enumerate(phase["subtasks"]):
-                subtask_id = subtask.get("id", f"subtask_{j}")
-                for req_field in subtask_schema.required_fields:
-                    if req_field not in subtask:
-                        errors.append(
-                            f"Phase {phase_id}, Subtask {subtask_id}: "
-                            f"Missing required field '{req_field}'"
-                        )
-
-                # Validate status
-                if "status" in subtask:
-                    allowed_status = subtask_schema.allowed_values.get("status", [])
-                    if allowed_status and subtask["status"] not in allowed_status:
-                        warnings.append(
-                            f"Phase {phase_id}, Subtask {subtask_id}: "
-                            f"Unknown status '{subtask['status']}'"
-                        )
+        # Validate all subtasks in one flat pass over phases[].subtasks[]
+        required = subtask_schema.required_fields
+        for phase_id, subtask_id, subtask in _iter_subtasks(phases):
+            for req_field in required:
+                if req_field not in subtask:
+                    errors.append(
+                        f"Phase {phase_id}, Subtask {subtask_id}: "
+                        f"Missing required field '{req_field}'"
+                    )
+            if (
+                allowed_status
+                and "status" in subtask
+                and not _is_allowed(subtask["status"], allowed_status)
+            ):
+                warnings.append(
+                    f"Phase {phase_id}, Subtask {subtask_id}: "
+                    f"Unknown status '{subtask['status']}'"
+                )
 
 
 # ============================================================================
@@ -1123,16 +1542,43 @@ class SpecValidator:
         "requirements.json",
     ]
 
+    # Schemas shared by every instance that does not pass its own, so
+    # validators for many directories reuse one compiled set (see configure())
+    _context_schema: ValidationSchema = DEFAULT_CONTEXT_SCHEMA
+    _implementation_plan_schema: ValidationSchema = DEFAULT_IMPLEMENTATION_PLAN_SCHEMA
+
+    @classmethod
+    def configure(
+        cls,
+        context_schema: Optional[ValidationSchema] = None,
+        implementation_plan_schema: Optional[ValidationSchema] = None,
+    ) -> None:
+        """
+        Set the default schemas used by all SpecValidator instances.
+
+        Instances created afterwards without explicit schemas share these,
+        keeping the compiled-schema cache warm across directories.
+
+        Args:
+            context_schema: Default schema for context.json validation
+            implementation_plan_schema: Default schema for implementation_plan.json
+        """
+        if context_schema is not None:
+            cls._context_schema = context_schema
+        if implementation_plan_schema is not None:
+            cls._implementation_plan_schema = implementation_plan_schema
+
     def __init__(
         self,
         spec_dir: Union[str, Path],
         context_schema: Optional[ValidationSchema] = None,
         implementation_plan_schema: Optional[ValidationSchema] = None,
-        spec_required_sections: Optional[List[str]] = None,
-        spec_recommended_sections: Optional[List[str]] = None,
+        spec_required_sections: Optional[Iterable[str]] = None,
+        spec_recommended_sections: Optional[Iterable[str]] = None,
         additional_validators: Optional[Dict[str, Type[BaseValidator]]] = None,
         validator_configs: Optional[Dict[str, Dict[str, Any]]] = None,
         enable_cache: bool = False,
+        force_reload: bool = False,
     ) -> None:
         """
         Initialize the spec validator.
@@ -1140,13 +1586,19 @@ class SpecValidator:
         Args:
             spec_dir: Path to the spec directory
             context_schema: Custom schema for context.json validation
+                (defaults to the class-level schema set via configure())
             implementation_plan_schema: Custom schema for implementation_plan.json
+                (defaults to the class-level schema set via configure())
             spec_required_sections: Custom required sections for spec.md
             spec_recommended_sections: Custom recommended sections for spec.md
             additional_validators: Dict mapping names to validator classes
             validator_configs: Dict mapping validator names to config kwargs
             enable_cache: Enable caching of validation results based on mtime
+            force_reload: Discard memoized file contents shared across validators
         """
+        if force_reload:
+            _clear_document_cache()
+
         self.spec_dir = Path(spec_dir)
         self._validator_configs = validator_configs or {}
         self._enable_cache = enable_cache
@@ -1161,7 +1613,7 @@ class SpecValidator:
         )
         self._context = ContextValidator(
             self.spec_dir,
-            schema=context_schema,
+            schema=context_schema or self._context_schema,
         )
         self._spec_document = SpecDocumentValidator(
             self.spec_dir,
@@ -1170,7 +1622,7 @@ class SpecValidator:
         )
         self._implementation_plan = ImplementationPlanValidator(
             self.spec_dir,
-            schema=implementation_plan_schema,
+            schema=implementation_plan_schema or self._implementation_plan_schema,
         )
 
         # Store additional validators
@@ -1309,11 +1761,24 @@ class SpecValidator:
         """
         Check if all validations pass.
 
+        Stops at the first failing checkpoint instead of running them all.
+        Use validate_all() or get_summary() when every result is needed.
+
         Returns:
             True if all checkpoints are valid
         """
-        results = self.validate_all()
-        return all(r.valid for r in results)
+        if self._is_cache_valid("validate_all"):
+            _, cached_results = self._validation_cache["validate_all"]
+            return all(r.valid for r in cached_results)
+
+        checks = (
+            self.validate_prereqs,
+            self.validate_context,
+            self.validate_spec_document,
+            self.validate_implementation_plan,
+            *(validator.validate for validator in self._additional_validators.values()),
+        )
+        return all(check().valid for check in checks)
 
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -1383,6 +1848,26 @@ def validate_spec_directory(
     return validator.get_summary()
 
 
+@lru_cache(maxsize=128)
+def _schema_from_json(schema_json: str) -> ValidationSchema:
+    """Build a ValidationSchema from its JSON-serialized config (cached)."""
+    return ValidationSchema(**json.loads(schema_json))
+
+
+def _schema_from_config(schema_config: Dict[str, Any]) -> ValidationSchema:
+    """
+    Build a ValidationSchema from a config dict, reusing identical configs.
+
+    Configs that are not JSON-serializable (e.g. containing custom validator
+    functions or nested ValidationSchema instances) are built uncached.
+    """
+    try:
+        schema_json = json.dumps(schema_config, sort_keys=True)
+    except TypeError:
+        return ValidationSchema(**schema_config)
+    return _schema_from_json(schema_json)
+
+
 def create_validator_from_config(
     spec_dir: Union[str, Path],
     config: Dict[str, Any],
@@ -1399,11 +1884,11 @@ def create_validator_from_config(
     """
     context_schema = None
     if "context_schema" in config:
-        context_schema = ValidationSchema(**config["context_schema"])
+        context_schema = _schema_from_config(config["context_schema"])
 
     plan_schema = None
     if "implementation_plan_schema" in config:
-        plan_schema = ValidationSchema(**config["implementation_plan_schema"])
+        plan_schema = _schema_from_config(config["implementation_plan_schema"])
 
     return SpecValidator(
         spec_dir=spec_dir,
@@ -78,6 +78,23 @@ def test_imports():
         print(f"  [FAIL] ValidationSchema error: {e}")
         return False
 
+    # Test compiled schemas are only shared between identical definitions
+    try:
+        from decimal import Decimal
+
+        ValidationSchema(allowed_values={"s": ["1"]}).compiled()
+        schema = ValidationSchema(allowed_values={"s": [Decimal("1")]})
+        assert schema.validate_data({"s": Decimal("1")}) == ([], [])
+
+        # Unhashable allowed values are still compared by equality
+        schema = ValidationSchema(allowed_values={"s": [["a"]]})
+        assert schema.validate_data({"s": ["a"]}) == ([], [])
+        assert schema.validate_data({"s": ["b"]})[1] == ["Unknown value for s: ['b']"]
+        print("  [OK] Compiled schema sharing works")
+    except Exception as e:
+        print(f"  [FAIL] Compiled schema sharing error: {e}")
+        return False
+
     # Test SpecValidator with temp directory
     try:
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -204,6 +221,227 @@ All tests pass.
         print(f"  [FAIL] validate_spec_directory error: {e}")
         return False
 
+    # Test plan checks skip malformed entries and report phases before subtasks
+    try:
+        from spec_validation import ImplementationPlanValidator
+
+        plan = {"feature": "x", "workflow_type": "feature", "phases": [
+            "junk",
+            {"id": "1", "subtasks": [
+                {"id": "a", "status": "weird"},
+                "junk",
+                {"description": "d", "status": "pending"},
+            ]},
+            {"name": "second", "subtasks": "junk"},
+            {"phase": 3, "name": "third", "subtasks": [
+                {"id": "c", "description": "d", "status": "done?"},
+            ]},
+        ]}
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmppath = Path(tmpdir)
+            (tmppath / "implementation_plan.json").write_text(json.dumps(plan))
+            result = ImplementationPlanValidator(tmppath).validate()
+        assert result.errors == [
+            "phases[1].Missing required field: name",
+            "phases[1].subtasks[0].Missing required field: description",
+            "phases[1].subtasks[2].Missing required field: id",
+            "phases[2].Missing one of required fields: phase, id",
+            "Phase 1: Missing required field 'name'",
+            "Phase index_2: Missing identifier (need 'id' or 'phase')",
+            "Phase 1, Subtask a: Missing required field 'description'",
+            "Phase 1, Subtask subtask_2: Missing required field 'id'",
+        ], result.errors
+        assert result.warnings == [
+            "phases[1].subtasks[0].Unknown value for status: weird",
+            "phases[3].subtasks[0].Unknown value for status: done?",
+            "Phase 1, Subtask a: Unknown status 'weird'",
+            "Phase 3, Subtask c: Unknown status 'done?'",
+        ], result.warnings
+        print("  [OK] Implementation plan junk entries handled")
+    except Exception as e:
+        print(f"  [FAIL] Implementation plan error: {e}")
+        return False
+
+    # Test memoized files are re-read on change and on force_reload
+    try:
+        import os
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmppath = Path(tmpdir)
+            context_file = tmppath / "context.json"
+            valid_content = '{"task_description": "ab"}'
+            invalid_content = '{"task_descriptioX": "ab"}'  # same size
+
+            context_file.write_text(valid_content)
+            assert SpecValidator(tmppath).validate_context().valid is True
+
+            # Size change is picked up
+            context_file.write_text(json.dumps({"description": "Changed"}))
+            assert SpecValidator(tmppath).validate_context().valid is False
+
+            # Same size, new mtime is picked up
+            context_file.write_text(valid_content)
+            assert SpecValidator(tmppath).validate_context().valid is True
+            stat = context_file.stat()
+            context_file.write_text(invalid_content)
+            os.utime(context_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            assert SpecValidator(tmppath).validate_context().valid is False
+
+            # Same size and mtime is only picked up with force_reload
+            stat = context_file.stat()
+            context_file.write_text(valid_content)
+            os.utime(context_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            assert SpecValidator(tmppath).validate_context().valid is False
+            assert SpecValidator(tmppath, force_reload=True).validate_context().valid is True
+
+            # Overrides that modify the data do not corrupt the memoized copy
+            class NormalizingValidator(ContextValidator):
+                def _process_json_data(self, data, errors, warnings, fixes):
+                    data.pop("task_description", None)
+                    super()._process_json_data(data, errors, warnings, fixes)
+
+            context_file.write_text(json.dumps({"task_description": "Test"}))
+            assert NormalizingValidator(tmppath).validate().valid is False
+            assert SpecValidator(tmppath).validate_context().valid is True
+        print("  [OK] Memoized files re-read on change and force_reload")
+    except Exception as e:
+        print(f"  [FAIL] File memoization error: {e}")
+        return False
+
+    # Test a header also satisfies shorter sections it starts with
+    try:
+        found = MarkdownDocumentValidator._find_sections(
+            b"## Files to Modify\n", ["Files", "Files to Modify", "Overview"]
+        )
+        assert found == {"Files", "Files to Modify"}
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmppath = Path(tmpdir)
+            (tmppath / "notes.md").write_text("# files to modify\n" + "x" * 500)
+            result = MarkdownDocumentValidator(
+                tmppath, "notes.md", "notes", required_sections=["Files"]
+            ).validate()
+            assert result.valid is True
+        print("  [OK] Section prefix matching works")
+    except Exception as e:
+        print(f"  [FAIL] Section prefix error: {e}")
+        return False
+
+    # Test SpecValidator.configure() sets shared default schemas
+    try:
+        custom_schema = ValidationSchema(required_fields=["custom_field"])
+        try:
+            SpecValidator.configure(context_schema=custom_schema)
+            with tempfile.TemporaryDirectory() as tmpdir:
+                tmppath = Path(tmpdir)
+                (tmppath / "context.json").write_text(json.dumps({"task_description": "Test"}))
+
+                result = SpecValidator(tmppath).validate_context()
+                assert result.valid is False
+                assert "custom_field" in result.errors[0]
+
+                # An explicit schema still takes precedence
+                explicit = SpecValidator(tmppath, context_schema=DEFAULT_CONTEXT_SCHEMA)
+                assert explicit.validate_context().valid is True
+        finally:
+            SpecValidator.configure(context_schema=DEFAULT_CONTEXT_SCHEMA)
+        print("  [OK] SpecValidator.configure works")
+    except Exception as e:
+        print(f"  [FAIL] SpecValidator.configure error: {e}")
+        return False
+
+    # Test is_valid stops at the first failure and reuses cached results
+    try:
+        class CountingValidator(BaseValidator):
+            calls = 0
+
+            def validate(self) -> SpecValidationResult:
+                CountingValidator.calls += 1
+                return self._create_result("counting")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmppath = Path(tmpdir)
+
+            # Missing spec directory fails prerequisites; later checks are skipped
+            validator = SpecValidator(
+                tmppath / "missing",
+                additional_validators={"counting": CountingValidator},
+            )
+            assert validator.is_valid() is False
+            assert CountingValidator.calls == 0
+
+            # Fresh cached validate_all results are reused
+            (tmppath / "context.json").write_text(json.dumps({"task_description": "Test"}))
+            validator = SpecValidator(
+                tmppath,
+                additional_validators={"counting": CountingValidator},
+                enable_cache=True,
+            )
+            results = validator.validate_all()
+            assert CountingValidator.calls == 1
+            assert validator.is_valid() is all(r.valid for r in results)
+            assert CountingValidator.calls == 1
+        print("  [OK] is_valid short-circuits and uses cache")
+    except Exception as e:
+        print(f"  [FAIL] is_valid error: {e}")
+        return False
+
+    # Test non-ASCII section names keep Unicode case-insensitive matching
+    try:
+        found = MarkdownDocumentValidator._find_sections(
+            "# \u00f1and\u00fa\n## Overview\n",
+            ["\u00d1and\u00fa", "Overview"],
+        )
+        assert found == {"\u00d1and\u00fa", "Overview"}
+        print("  [OK] Non-ASCII section matching works")
+    except Exception as e:
+        print(f"  [FAIL] Non-ASCII section error: {e}")
+        return False
+
+    # Test headers are found as in the decoded text (Unicode spaces, CR newlines)
+    try:
+        documents = [
+            "##\u00a0Overview\n",
+            "#\u3000Overview\n",
+            "# Intro\r## Overview\r",
+            "# Intro\r\n## Overview\r\n",
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmppath = Path(tmpdir)
+            for i, document in enumerate(documents):
+                filename = f"notes{i}.md"
+                (tmppath / filename).write_bytes(document.encode("utf-8"))
+                result = MarkdownDocumentValidator(
+                    tmppath, filename, "notes",
+                    required_sections=["Overview"], min_length=25,
+                ).validate()
+                assert result.errors == [], document
+                length = len(document.replace("\r\n", "\n"))
+                assert result.warnings == [
+                    f"Document seems too short ({length} chars, recommended minimum: 25)"
+                ], document
+        print("  [OK] Section matching follows decoded text")
+    except Exception as e:
+        print(f"  [FAIL] Section decoding error: {e}")
+        return False
+
+    # Test JSON decoding accepts what the json module accepts
+    try:
+        from spec_validation import _json_loads
+        import math
+
+        values = _json_loads(b'[NaN, Infinity, -Infinity]')
+        assert math.isnan(values[0]) and values[1] == math.inf and values[2] == -math.inf
+        try:
+            _json_loads(b'{bad')
+            assert False, "invalid JSON should raise"
+        except json.JSONDecodeError:
+            pass
+        print("  [OK] JSON decoding matches json module")
+    except Exception as e:
+        print(f"  [FAIL] JSON decoding error: {e}")
+        return False
+
     print("\nAll tests passed! spec_validation is ready to use.")
     return True
 